@@ -0,0 +1,54 @@
+"""Denormalize latest total score onto student
+
+Revision ID: d4e5f6g7h8i9
+Revises: c3d4e5f6g7h8
+Create Date: 2025-02-10 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6g7h8i9"
+down_revision = "c3d4e5f6g7h8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Add latest score columns to student table
+    op.add_column("student", sa.Column("latest_score", sa.Float(), nullable=True))
+    op.add_column(
+        "student",
+        sa.Column(
+            "latest_color",
+            postgresql.ENUM("green", "yellow", "red", name="scorecolor", create_type=False),
+            nullable=True,
+        ),
+    )
+    op.add_column("student", sa.Column("last_response_date", sa.DateTime(), nullable=True))
+
+    # Backfill from the most recent total score of each student
+    op.execute(
+        """
+        UPDATE student
+        SET latest_score = latest.score_value,
+            latest_color = latest.color,
+            last_response_date = latest.calculated_at
+        FROM (
+            SELECT DISTINCT ON (student_id) student_id, score_value, color, calculated_at
+            FROM score
+            WHERE is_total
+            ORDER BY student_id, calculated_at DESC
+        ) AS latest
+        WHERE latest.student_id = student.id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("student", "last_response_date")
+    op.drop_column("student", "latest_color")
+    op.drop_column("student", "latest_score")
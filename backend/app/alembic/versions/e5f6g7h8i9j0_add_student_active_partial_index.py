@@ -0,0 +1,30 @@
+"""Add partial index on active students
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2025-02-10 13:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e5f6g7h8i9j0"
+down_revision = "d4e5f6g7h8i9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_student_active",
+        "student",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_student_active", table_name="student")
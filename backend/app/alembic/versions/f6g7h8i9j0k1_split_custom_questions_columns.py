@@ -0,0 +1,57 @@
+"""Replace custom_questions JSON with two varchar columns
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2025-02-10 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "f6g7h8i9j0k1"
+down_revision = "e5f6g7h8i9j0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Add one column per custom question slot
+    op.add_column("surveysession", sa.Column("custom_question_0", sa.String(), nullable=True))
+    op.add_column("surveysession", sa.Column("custom_question_1", sa.String(), nullable=True))
+
+    # Backfill from the JSON list
+    op.execute(
+        """
+        UPDATE surveysession
+        SET custom_question_0 = custom_questions->>0,
+            custom_question_1 = custom_questions->>1
+        WHERE custom_questions IS NOT NULL
+        """
+    )
+
+    op.drop_column("surveysession", "custom_questions")
+
+
+def downgrade():
+    op.add_column(
+        "surveysession",
+        sa.Column("custom_questions", postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE surveysession
+        SET custom_questions = CASE
+            WHEN custom_question_1 IS NOT NULL
+                THEN json_build_array(custom_question_0, custom_question_1)
+            ELSE json_build_array(custom_question_0)
+        END
+        WHERE custom_question_0 IS NOT NULL
+        """
+    )
+
+    op.drop_column("surveysession", "custom_question_1")
+    op.drop_column("surveysession", "custom_question_0")
@@ -0,0 +1,27 @@
+"""Replace student email index with composite email/status index
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2025-02-10 15:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "g7h8i9j0k1l2"
+down_revision = "f6g7h8i9j0k1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_student_email", table_name="student")
+    op.create_index(
+        "ix_student_email_status", "student", ["email", "status"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index("ix_student_email_status", table_name="student")
+    op.create_index("ix_student_email", "student", ["email"], unique=False)
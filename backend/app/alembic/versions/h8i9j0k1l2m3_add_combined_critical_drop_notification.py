@@ -0,0 +1,30 @@
+"""Add combined critical score and drop notification type
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2025-02-10 16:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "h8i9j0k1l2m3"
+down_revision = "g7h8i9j0k1l2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TYPE notificationtype ADD VALUE IF NOT EXISTS 'critical_score_drop'"
+    )
+
+
+def downgrade():
+    # PostgreSQL cannot drop a value from an enum type; fold any combined
+    # alerts back into critical score alerts and leave the value in place
+    op.execute(
+        "UPDATE notification SET type = 'critical_score' "
+        "WHERE type = 'critical_score_drop'"
+    )
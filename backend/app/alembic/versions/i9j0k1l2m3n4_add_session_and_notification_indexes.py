@@ -0,0 +1,51 @@
+"""Add survey session and notification lookup indexes
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2025-02-10 17:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "i9j0k1l2m3n4"
+down_revision = "h8i9j0k1l2m3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_surveysession_status_token_expires_at",
+        "surveysession",
+        ["status", "token_expires_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_surveysession_student_id_year_week",
+        "surveysession",
+        ["student_id", "year", "week_number"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notification_user_id_type_unread",
+        "notification",
+        ["user_id", "type"],
+        unique=False,
+        postgresql_where=sa.text("read_at IS NULL"),
+    )
+    op.create_index(
+        "ix_notification_user_id_sent_at",
+        "notification",
+        ["user_id", "sent_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_notification_user_id_sent_at", table_name="notification")
+    op.drop_index("ix_notification_user_id_type_unread", table_name="notification")
+    op.drop_index("ix_surveysession_student_id_year_week", table_name="surveysession")
+    op.drop_index("ix_surveysession_status_token_expires_at", table_name="surveysession")
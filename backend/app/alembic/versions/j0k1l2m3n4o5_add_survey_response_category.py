@@ -0,0 +1,45 @@
+"""Denormalize question category onto survey responses
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2025-02-10 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "j0k1l2m3n4o5"
+down_revision = "i9j0k1l2m3n4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "surveyresponse",
+        sa.Column(
+            "category",
+            postgresql.ENUM(
+                "trivsel", "motivation", "faellesskab", "selvindsigt", "arbejdsparathed",
+                name="surveycategory", create_type=False,
+            ),
+            nullable=True,
+        ),
+    )
+
+    # Backfill from the answered question; custom responses stay NULL
+    op.execute(
+        """
+        UPDATE surveyresponse
+        SET category = surveyquestion.category
+        FROM surveyquestion
+        WHERE surveyquestion.id = surveyresponse.question_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("surveyresponse", "category")
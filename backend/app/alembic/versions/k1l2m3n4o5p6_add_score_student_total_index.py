@@ -0,0 +1,28 @@
+"""Add score lookup index for a student's latest totals
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2025-02-10 19:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "k1l2m3n4o5p6"
+down_revision = "j0k1l2m3n4o5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_score_student_id_is_total_calculated_at",
+        "score",
+        ["student_id", "is_total", "calculated_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_score_student_id_is_total_calculated_at", table_name="score")
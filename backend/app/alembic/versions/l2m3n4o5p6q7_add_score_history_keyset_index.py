@@ -0,0 +1,43 @@
+"""Cover total score lookups and add score history keyset index
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2025-02-10 20:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "l2m3n4o5p6q7"
+down_revision = "k1l2m3n4o5p6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index("ix_score_student_id_is_total_calculated_at", table_name="score")
+    op.create_index(
+        "ix_score_student_id_is_total_calculated_at",
+        "score",
+        ["student_id", "is_total", "calculated_at"],
+        unique=False,
+        postgresql_include=["score_value", "session_id"],
+    )
+    op.create_index(
+        "ix_score_student_id_calculated_at_is_total_id",
+        "score",
+        ["student_id", "calculated_at", "is_total", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_score_student_id_calculated_at_is_total_id", table_name="score")
+    op.drop_index("ix_score_student_id_is_total_calculated_at", table_name="score")
+    op.create_index(
+        "ix_score_student_id_is_total_calculated_at",
+        "score",
+        ["student_id", "is_total", "calculated_at"],
+        unique=False,
+    )
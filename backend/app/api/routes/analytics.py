@@ -7,6 +7,7 @@ Only analysts and admins can access these routes.
 
 import io
 import csv
+from collections.abc import Iterator
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
@@ -14,6 +15,7 @@ from fastapi.responses import StreamingResponse
 
 from app import crud
 from app.api.deps import CurrentUser, SessionDep
+from app.core.db import engine
 from app.models import (
     AnalyticsExportRow,
     AnalyticsSummary,
@@ -21,10 +23,25 @@ from app.models import (
     SessionStatus,
     StaffRole,
 )
-from sqlmodel import select, func
+from sqlmodel import Session, select, func
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# Rows fetched per round trip when streaming the CSV export
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    "internal_id",
+    "week_number",
+    "year",
+    "phase",
+    "category",
+    "score",
+    "color",
+    "is_total",
+    "completed_at",
+]
+
 
 def check_analyst_access(current_user: CurrentUser) -> None:
     """Verify user has analyst or admin access."""
@@ -137,9 +154,19 @@ def export_data(
 
     from app.models import Student, Score, SurveySession
 
-    # Build query for scores with student and session info
+    # Build query for only the exported columns of scores with student and session info
     statement = (
-        select(Score, Student, SurveySession)
+        select(
+            Student.internal_id,
+            SurveySession.week_number,
+            SurveySession.year,
+            Student.phase,
+            Score.category,
+            Score.score_value.label("score"),
+            Score.color,
+            Score.is_total,
+            Score.calculated_at.label("completed_at"),
+        )
         .join(Student, Score.student_id == Student.id)
         .join(SurveySession, Score.session_id == SurveySession.id)
         .where(Student.consent_status == True)
@@ -152,63 +179,46 @@ def export_data(
 
     statement = statement.order_by(Score.calculated_at.desc())
 
-    results = session.exec(statement).all()
-
-    # Build export data
-    export_rows = []
-    for score, student, survey_session in results:
-        row = AnalyticsExportRow(
-            internal_id=student.internal_id,
-            week_number=survey_session.week_number,
-            year=survey_session.year,
-            phase=student.phase,
-            category=score.category,
-            score=score.score_value,
-            color=score.color,
-            is_total=score.is_total,
-            completed_at=score.calculated_at,
-        )
-        export_rows.append(row)
-
     if format == "json":
-        return [row.model_dump() for row in export_rows]
-
-    # CSV export
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow([
-        "internal_id",
-        "week_number",
-        "year",
-        "phase",
-        "category",
-        "score",
-        "color",
-        "is_total",
-        "completed_at",
-    ])
-
-    # Data rows
-    for row in export_rows:
-        writer.writerow([
-            row.internal_id,
-            row.week_number,
-            row.year,
-            row.phase.value,
-            row.category.value if row.category else "",
-            row.score,
-            row.color.value,
-            row.is_total,
-            row.completed_at.isoformat(),
-        ])
-
-    output.seek(0)
+        return [
+            AnalyticsExportRow.model_validate(dict(row._mapping)).model_dump()
+            for row in session.exec(statement).all()
+        ]
+
+    def generate_csv() -> Iterator[str]:
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        # Header
+        writer.writerow(EXPORT_COLUMNS)
+        yield output.getvalue()
+
+        # The request session may already be closed while the body streams,
+        # so rows are read on a dedicated session through a server-side cursor
+        with Session(engine) as stream_session:
+            result = stream_session.exec(
+                statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+            )
+            for rows in result.partitions():
+                output.seek(0)
+                output.truncate(0)
+                for row in rows:
+                    writer.writerow([
+                        row.internal_id,
+                        row.week_number,
+                        row.year,
+                        row.phase.value,
+                        row.category.value if row.category else "",
+                        row.score,
+                        row.color.value,
+                        row.is_total,
+                        row.completed_at.isoformat(),
+                    ])
+                yield output.getvalue()
 
     # Return as downloadable file
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate_csv(),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=trivselstracker_export_{datetime.now().strftime('%Y%m%d')}.csv"
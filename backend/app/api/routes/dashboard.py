@@ -14,13 +14,14 @@ from app.models import (
     AlertInfo,
     AlertsResponse,
     DashboardOverview,
-    NotificationPublic,
-    NotificationsPublic,
     ScoreColor,
     StaffRole,
     StudentWithLatestScore,
 )
-from app.services.alerts import get_alert_summary_for_mentor
+from app.services.alerts import (
+    get_alert_summary_for_mentor,
+    invalidate_alert_summary,
+)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -40,7 +41,7 @@ def get_dashboard_overview(
     if not current_user.is_superuser and current_user.role not in [StaffRole.ADMIN, StaffRole.ANALYST]:
         user_id = current_user.id
 
-    students_with_scores = crud.get_students_with_latest_scores(
+    students_data = crud.get_students_with_latest_scores(
         session=session,
         user_id=user_id,
     )
@@ -51,31 +52,13 @@ def get_dashboard_overview(
     red_count = 0
     non_response_count = 0
 
-    students_data = []
-    for student, score in students_with_scores:
-        student_data = StudentWithLatestScore(
-            id=student.id,
-            internal_id=student.internal_id,
-            name=student.name,
-            email=student.email,
-            phase=student.phase,
-            consent_status=student.consent_status,
-            status=student.status,
-            consent_date=student.consent_date,
-            created_at=student.created_at,
-            latest_score=score.score_value if score else None,
-            latest_color=score.color if score else None,
-            last_response_date=score.calculated_at if score else None,
-        )
-        students_data.append(student_data)
-
-        if score:
-            if score.color == ScoreColor.GREEN:
-                green_count += 1
-            elif score.color == ScoreColor.YELLOW:
-                yellow_count += 1
-            elif score.color == ScoreColor.RED:
-                red_count += 1
+    for student_data in students_data:
+        if student_data.latest_color == ScoreColor.GREEN:
+            green_count += 1
+        elif student_data.latest_color == ScoreColor.YELLOW:
+            yellow_count += 1
+        elif student_data.latest_color == ScoreColor.RED:
+            red_count += 1
         else:
             non_response_count += 1
 
@@ -100,7 +83,7 @@ def get_alerts(
     """
     Get alerts/notifications for the current user.
     """
-    notifications, count = crud.get_user_notifications(
+    notifications, count = crud.get_user_notifications_with_student_names(
         session=session,
         user_id=current_user.id,
         unread_only=unread_only,
@@ -109,18 +92,11 @@ def get_alerts(
     )
 
     alerts_data = []
-    for notification in notifications:
-        # Get student name if notification is about a student
-        student_name = "Unknown"
-        if notification.student_id:
-            student = crud.get_student(session=session, student_id=notification.student_id)
-            if student:
-                student_name = student.name
-
+    for notification, student_name in notifications:
         alert = AlertInfo(
             id=notification.id,
             student_id=notification.student_id,
-            student_name=student_name,
+            student_name=student_name or "Unknown",
             type=notification.type,
             title=notification.title,
             message=notification.message,
@@ -136,7 +112,7 @@ def get_alerts(
 def get_alert_summary(
     session: SessionDep,
     current_user: CurrentUser,
-) -> dict:
+) -> dict[str, int]:
     """
     Get summary of unread alerts by type.
     """
@@ -151,7 +127,7 @@ def mark_alert_read(
     session: SessionDep,
     current_user: CurrentUser,
     notification_id: uuid.UUID,
-) -> dict:
+) -> dict[str, str]:
     """
     Mark a notification as read.
     """
@@ -165,6 +141,7 @@ def mark_alert_read(
         return {"message": "Not authorized"}
 
     crud.mark_notification_read(session=session, db_notification=notification)
+    invalidate_alert_summary(current_user.id)
     return {"message": "Notification marked as read"}
 
 
@@ -181,27 +158,7 @@ def get_high_risk_students(
     if not current_user.is_superuser and current_user.role not in [StaffRole.ADMIN, StaffRole.ANALYST]:
         user_id = current_user.id
 
-    high_risk = crud.get_high_risk_students(
+    return crud.get_high_risk_students(
         session=session,
         user_id=user_id,
     )
-
-    students_data = []
-    for student, score in high_risk:
-        student_data = StudentWithLatestScore(
-            id=student.id,
-            internal_id=student.internal_id,
-            name=student.name,
-            email=student.email,
-            phase=student.phase,
-            consent_status=student.consent_status,
-            status=student.status,
-            consent_date=student.consent_date,
-            created_at=student.created_at,
-            latest_score=score.score_value,
-            latest_color=score.color,
-            last_response_date=score.calculated_at,
-        )
-        students_data.append(student_data)
-
-    return students_data
@@ -7,11 +7,14 @@ These routes require authentication. Access is controlled based on user role:
 - Analyst: Read-only access to anonymized data (handled in analytics routes)
 """
 
+import base64
+import binascii
 import uuid
 import logging
 from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from app import crud
 from app.api.deps import CurrentUser, SessionDep
@@ -23,6 +26,7 @@ from app.models import (
     InterventionPublic,
     InterventionsPublic,
     Message,
+    Score,
     ScoreHistory,
     ScorePublic,
     ScoresPublic,
@@ -38,6 +42,32 @@ from app.models import (
 
 router = APIRouter(prefix="/students", tags=["students"])
 
+# Validate whole result lists in one pass through pydantic-core
+student_list_adapter = TypeAdapter(list[StudentPublic])
+score_list_adapter = TypeAdapter(list[ScorePublic])
+
+
+def encode_score_cursor(score: Score) -> str:
+    """Encode a score's position in the score history as an opaque page cursor"""
+    key = f"{score.calculated_at.isoformat()}|{int(score.is_total)}|{score.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_score_cursor(cursor: str) -> tuple[datetime, bool, uuid.UUID]:
+    """Decode a score history page cursor, rejecting malformed ones"""
+    try:
+        calculated_at, is_total, score_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        if is_total not in ("0", "1"):
+            raise ValueError(is_total)
+        return datetime.fromisoformat(calculated_at), is_total == "1", uuid.UUID(score_id)
+    except (ValueError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
 
 def check_student_access(
     current_user: CurrentUser,
@@ -91,7 +121,7 @@ def get_students(
         )
 
     return StudentsPublic(
-        data=[StudentPublic.model_validate(s) for s in students],
+        data=student_list_adapter.validate_python(students, from_attributes=True),
         count=count,
     )
 
@@ -299,9 +329,12 @@ def get_student_scores(
     current_user: CurrentUser,
     student_id: uuid.UUID,
     limit: int = Query(default=50, le=100),
+    cursor: str | None = None,
 ) -> ScoresPublic:
     """
     Get score history for a student.
+
+    Pass the next_cursor of a page as cursor to get the next page.
     """
     student = crud.get_student(session=session, student_id=student_id)
     if not student:
@@ -312,13 +345,18 @@ def get_student_scores(
 
     check_student_access(current_user, student, session)
 
+    before = decode_score_cursor(cursor) if cursor is not None else None
+
     scores = crud.get_student_scores(
-        session=session, student_id=student_id, limit=limit
+        session=session, student_id=student_id, limit=limit, before=before
     )
 
     return ScoresPublic(
-        data=[ScorePublic.model_validate(s) for s in scores],
+        data=score_list_adapter.validate_python(scores, from_attributes=True),
         count=len(scores),
+        next_cursor=(
+            encode_score_cursor(scores[-1]) if scores and len(scores) == limit else None
+        ),
     )
 
 
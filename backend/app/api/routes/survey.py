@@ -7,7 +7,7 @@ Students receive a link with their token via email.
 
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from sqlmodel import Session
 
 from app import crud
@@ -134,6 +134,7 @@ async def submit_responses(
     token: str,
     responses: SurveyResponseBulkCreate,
     session: SessionDep,
+    background_tasks: BackgroundTasks,
 ) -> SurveySubmitResponse:
     """
     Submit all responses for a survey.
@@ -224,6 +225,7 @@ async def submit_responses(
         session=session,
         session_id=survey_session.id,
         responses=responses.responses,
+        question_categories={q.id: q.category for q in expected_questions},
     )
 
     # Create custom responses if any
@@ -250,12 +252,11 @@ async def submit_responses(
         status=SessionStatus.COMPLETED,
     )
 
-    # Check for alerts
-    await alerts.check_for_alerts(
-        db_session=session,
-        survey_session=survey_session,
-        scores=scores,
-        student=student,
+    # Check for alerts after the response has been sent
+    background_tasks.add_task(
+        alerts.check_for_alerts_in_background,
+        survey_session_id=survey_session.id,
+        student_id=student.id,
     )
 
     # Get total score for response
@@ -5,6 +5,7 @@ These routes are typically called by cron jobs or system administrators.
 Only superusers and admins can access these routes.
 """
 
+import logging
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, status
@@ -16,11 +17,15 @@ from app.models import (
     Message,
     SessionStatus,
     StaffRole,
+    Student,
     StudentStatus,
+    SurveySession,
 )
-from app.services import alerts
+from app.services import alerts, scoring
 from app.services.email import email_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/system", tags=["system"])
 
 
@@ -58,7 +63,8 @@ async def send_weekly_surveys(
         limit=1000,  # Reasonable limit for pilot
     )
 
-    sent_count = 0
+    invited: list[Student] = []
+    sends = []
     error_count = 0
 
     for student in students:
@@ -87,21 +93,34 @@ async def send_weekly_surveys(
                 year=year,
                 token_expiry_days=settings.SURVEY_TOKEN_EXPIRY_DAYS,
             )
+        except Exception:
+            error_count += 1
+            # Log error but continue with other students
+            logger.exception("Error creating survey session for student %s", student.id)
+            continue
 
-            # Send email
-            await email_service.send_survey_invitation(
+        invited.append(student)
+        sends.append(
+            email_service.send_survey_invitation(
                 student_email=student.email,
                 student_name=student.name,
                 token=survey_session.token,
                 week_number=week_number,
             )
+        )
 
-            sent_count += 1
+    # Send all emails concurrently
+    results = await email_service.send_many(sends)
 
-        except Exception as e:
+    sent_count = 0
+    for student, result in zip(invited, results, strict=True):
+        if isinstance(result, BaseException):
             error_count += 1
-            # Log error but continue with other students
-            print(f"Error sending survey to {student.email}: {e}")
+            logger.error(
+                "Error sending survey to student %s", student.id, exc_info=result
+            )
+        else:
+            sent_count += 1
 
     return Message(
         message=f"Surveys sent: {sent_count} successful, {error_count} errors"
@@ -124,8 +143,8 @@ async def send_reminders(
     # Get pending sessions
     pending_sessions = crud.get_pending_sessions(session=session)
 
-    sent_count = 0
-    error_count = 0
+    reminded: list[tuple[SurveySession, Student]] = []
+    sends = []
 
     for survey_session in pending_sessions:
         # Check if max reminders reached
@@ -137,24 +156,34 @@ async def send_reminders(
         if not student or not student.consent_status:
             continue
 
-        try:
-            # Send reminder
-            await email_service.send_survey_reminder(
+        reminded.append((survey_session, student))
+        sends.append(
+            email_service.send_survey_reminder(
                 student_email=student.email,
                 student_name=student.name,
                 token=survey_session.token,
                 week_number=survey_session.week_number,
                 reminder_number=survey_session.reminder_count + 1,
             )
+        )
 
-            # Increment reminder count
-            crud.increment_reminder_count(session=session, db_session=survey_session)
+    # Send all reminders concurrently
+    results = await email_service.send_many(sends)
 
-            sent_count += 1
+    sent_count = 0
+    error_count = 0
 
-        except Exception as e:
+    for (survey_session, student), result in zip(reminded, results, strict=True):
+        if isinstance(result, BaseException):
             error_count += 1
-            print(f"Error sending reminder to {student.email}: {e}")
+            logger.error(
+                "Error sending reminder to student %s", student.id, exc_info=result
+            )
+            continue
+
+        # Increment reminder count
+        crud.increment_reminder_count(session=session, db_session=survey_session)
+        sent_count += 1
 
     return Message(
         message=f"Reminders sent: {sent_count} successful, {error_count} errors"
@@ -179,6 +208,23 @@ async def process_expired_sessions(
     return Message(message=f"Processed {processed_count} expired sessions")
 
 
+@router.post("/rescore", response_model=Message)
+def rescore_scores(
+    session: SessionDep,
+    current_user: CurrentUser,
+) -> Message:
+    """
+    Recalculate all stored scores from the saved responses.
+
+    Run this after the scoring rules or color thresholds have changed.
+    """
+    check_system_access(current_user)
+
+    rescored_count = scoring.rescore_students(db_session=session)
+
+    return Message(message=f"Rescored {rescored_count} survey sessions")
+
+
 @router.get("/health")
 def health_check() -> dict:
     """
@@ -3,7 +3,8 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlmodel import Session, select, func
+from sqlmodel import Session, func, insert, select, tuple_, update
+from sqlmodel.sql.expression import Select
 
 from app.core.security import get_password_hash, verify_password
 from app.models import (
@@ -17,6 +18,7 @@ from app.models import (
     StudentUpdate,
     StudentStatus,
     StudentPhase,
+    StudentWithLatestScore,
     # Group models
     Group,
     GroupCreate,
@@ -40,6 +42,7 @@ from app.models import (
     SurveyResponseCreate,
     # Score models
     Score,
+    ScoreBase,
     ScoreColor,
     # Intervention models
     Intervention,
@@ -51,6 +54,8 @@ from app.models import (
     # Audit log models
     AuditLog,
     AuditLogCreate,
+    # Helpers
+    uuid7,
 )
 
 
@@ -120,6 +125,13 @@ def get_student(*, session: Session, student_id: uuid.UUID) -> Student | None:
     return session.get(Student, student_id)
 
 
+def get_students_by_ids(
+    *, session: Session, student_ids: list[uuid.UUID]
+) -> list[Student]:
+    statement = select(Student).where(Student.id.in_(student_ids))
+    return list(session.exec(statement).all())
+
+
 def get_student_by_email(*, session: Session, email: str) -> Student | None:
     statement = select(Student).where(Student.email == email)
     return session.exec(statement).first()
@@ -310,6 +322,15 @@ def get_student_assignments(
     return list(session.exec(statement).all())
 
 
+def get_assignments_for_students(
+    *, session: Session, student_ids: list[uuid.UUID]
+) -> list[StudentAssignment]:
+    statement = select(StudentAssignment).where(
+        StudentAssignment.student_id.in_(student_ids)
+    )
+    return list(session.exec(statement).all())
+
+
 def get_user_assignments(
     *, session: Session, user_id: uuid.UUID
 ) -> list[StudentAssignment]:
@@ -436,12 +457,14 @@ def create_survey_session(
     custom_questions: list[str] | None = None,
 ) -> SurveySession:
     """Create a new survey session for a student"""
+    custom_questions = custom_questions or []
     db_session = SurveySession(
         student_id=student_id,
         week_number=week_number,
         year=year,
         token_expires_at=datetime.utcnow() + timedelta(days=token_expiry_days),
-        custom_questions=custom_questions,
+        custom_question_0=custom_questions[0] if len(custom_questions) > 0 else None,
+        custom_question_1=custom_questions[1] if len(custom_questions) > 1 else None,
     )
     session.add(db_session)
     session.commit()
@@ -476,6 +499,35 @@ def get_student_sessions(
     return list(session.exec(statement).all())
 
 
+def get_recent_sessions_for_students(
+    *,
+    session: Session,
+    student_ids: list[uuid.UUID],
+    limit: int = 10,
+) -> list[SurveySession]:
+    """Get the most recent survey sessions for each of several students"""
+    ranked = (
+        select(
+            SurveySession.id,
+            func.row_number()
+            .over(
+                partition_by=SurveySession.student_id,
+                order_by=(SurveySession.year.desc(), SurveySession.week_number.desc()),
+            )
+            .label("rank"),
+        )
+        .where(SurveySession.student_id.in_(student_ids))
+        .subquery()
+    )
+    statement = (
+        select(SurveySession)
+        .join(ranked, SurveySession.id == ranked.c.id)
+        .where(ranked.c.rank <= limit)
+        .order_by(SurveySession.year.desc(), SurveySession.week_number.desc())
+    )
+    return list(session.exec(statement).all())
+
+
 def get_pending_sessions(*, session: Session) -> list[SurveySession]:
     """Get all pending sessions that haven't expired"""
     statement = select(SurveySession).where(
@@ -494,6 +546,26 @@ def get_expired_sessions(*, session: Session) -> list[SurveySession]:
     return list(session.exec(statement).all())
 
 
+def get_expired_session_rows(
+    *, session: Session
+) -> list[tuple[uuid.UUID, uuid.UUID, int, int]]:
+    """Get (id, student_id, year, week_number) of sessions that have expired but
+    not yet been marked, without loading the full sessions"""
+    statement = select(
+        SurveySession.id,
+        SurveySession.student_id,
+        SurveySession.year,
+        SurveySession.week_number,
+    ).where(
+        SurveySession.status.in_([SessionStatus.PENDING, SessionStatus.IN_PROGRESS]),
+        SurveySession.token_expires_at <= datetime.utcnow(),
+    )
+    return [
+        (session_id, student_id, year, week_number)
+        for session_id, student_id, year, week_number in session.exec(statement).all()
+    ]
+
+
 def update_session_status(
     *, session: Session, db_session: SurveySession, status: SessionStatus
 ) -> SurveySession:
@@ -506,6 +578,18 @@ def update_session_status(
     return db_session
 
 
+def update_sessions_status_bulk(
+    *, session: Session, session_ids: list[uuid.UUID], status: SessionStatus
+) -> None:
+    """Set the status of several sessions in a single UPDATE"""
+    session.execute(
+        update(SurveySession)
+        .where(SurveySession.id.in_(session_ids))
+        .values(status=status)
+    )
+    session.commit()
+
+
 def increment_reminder_count(
     *, session: Session, db_session: SurveySession
 ) -> SurveySession:
@@ -526,10 +610,13 @@ def create_response(
     session: Session,
     session_id: uuid.UUID,
     response_in: SurveyResponseCreate,
+    category: SurveyCategory,
 ) -> SurveyResponse:
+    """Create a response, storing the category of the question it answers"""
     db_response = SurveyResponse(
         session_id=session_id,
         question_id=response_in.question_id,
+        category=category,
         answer=response_in.answer,
     )
     session.add(db_response)
@@ -543,21 +630,33 @@ def create_responses_bulk(
     session: Session,
     session_id: uuid.UUID,
     responses: list[SurveyResponseCreate],
+    question_categories: dict[uuid.UUID, SurveyCategory],
 ) -> list[SurveyResponse]:
-    """Create multiple responses at once"""
-    db_responses = []
-    for response_in in responses:
-        db_response = SurveyResponse(
-            session_id=session_id,
-            question_id=response_in.question_id,
-            answer=response_in.answer,
-        )
-        session.add(db_response)
-        db_responses.append(db_response)
-    session.commit()
-    for r in db_responses:
-        session.refresh(r)
-    return db_responses
+    """
+    Create multiple responses at once.
+
+    Each response stores the category of its question, taken from
+    question_categories. Rows are sent as a single executemany INSERT instead
+    of going through the unit of work, so the returned objects are transient
+    and not refreshed.
+    """
+    answered_at = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid7(),
+            "session_id": session_id,
+            "question_id": response_in.question_id,
+            "custom_question_index": None,
+            "category": question_categories[response_in.question_id],
+            "answer": response_in.answer,
+            "answered_at": answered_at,
+        }
+        for response_in in responses
+    ]
+    if rows:
+        session.execute(insert(SurveyResponse), rows)
+        session.commit()
+    return [SurveyResponse(**row) for row in rows]
 
 
 def get_session_responses(
@@ -594,20 +693,22 @@ def create_custom_responses_bulk(
     custom_responses: list[tuple[int, int]],  # (index, answer)
 ) -> list[SurveyResponse]:
     """Create multiple custom responses at once"""
-    db_responses = []
-    for custom_question_index, answer in custom_responses:
-        db_response = SurveyResponse(
-            session_id=session_id,
-            question_id=None,
-            custom_question_index=custom_question_index,
-            answer=answer,
-        )
-        session.add(db_response)
-        db_responses.append(db_response)
-    session.commit()
-    for r in db_responses:
-        session.refresh(r)
-    return db_responses
+    answered_at = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid7(),
+            "session_id": session_id,
+            "question_id": None,
+            "custom_question_index": custom_question_index,
+            "answer": answer,
+            "answered_at": answered_at,
+        }
+        for custom_question_index, answer in custom_responses
+    ]
+    if rows:
+        session.execute(insert(SurveyResponse), rows)
+        session.commit()
+    return [SurveyResponse(**row) for row in rows]
 
 
 # =============================================================================
@@ -634,24 +735,86 @@ def create_score(
         is_total=is_total,
     )
     session.add(db_score)
+    if is_total:
+        update_student_latest_score(session=session, db_score=db_score)
     session.commit()
     session.refresh(db_score)
     return db_score
 
 
+def create_scores_bulk(
+    *,
+    session: Session,
+    student_id: uuid.UUID,
+    session_id: uuid.UUID,
+    scores: list[ScoreBase],
+) -> list[Score]:
+    """
+    Create all scores for a survey session in one transaction.
+
+    Rows are sent as a single executemany INSERT together with the student's
+    latest score update, so the returned objects are transient and not
+    refreshed.
+    """
+    calculated_at = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid7(),
+            "student_id": student_id,
+            "session_id": session_id,
+            "category": score_in.category,
+            "score_value": score_in.score_value,
+            "color": score_in.color,
+            "is_total": score_in.is_total,
+            "calculated_at": calculated_at,
+        }
+        for score_in in scores
+    ]
+    if not rows:
+        return []
+    session.execute(insert(Score), rows)
+    db_scores = [Score(**row) for row in rows]
+    for db_score in db_scores:
+        if db_score.is_total:
+            update_student_latest_score(session=session, db_score=db_score)
+    session.commit()
+    return db_scores
+
+
+def update_student_latest_score(*, session: Session, db_score: Score) -> None:
+    """Copy a new total score onto the student's denormalized latest_* columns"""
+    session.execute(
+        update(Student)
+        .where(Student.id == db_score.student_id)
+        .values(
+            latest_score=db_score.score_value,
+            latest_color=db_score.color,
+            last_response_date=db_score.calculated_at,
+        )
+    )
+
+
 def get_student_scores(
     *,
     session: Session,
     student_id: uuid.UUID,
     limit: int = 10,
+    before: tuple[datetime, bool, uuid.UUID] | None = None,
 ) -> list[Score]:
-    """Get recent scores for a student"""
-    statement = (
-        select(Score)
-        .where(Score.student_id == student_id)
-        .order_by(Score.calculated_at.desc())
-        .limit(limit)
-    )
+    """
+    Get recent scores for a student, each session's total first.
+
+    Pages are keyset based: pass the (calculated_at, is_total, id) of the last
+    score of a page as before to get the scores that follow it.
+    """
+    statement = select(Score).where(Score.student_id == student_id)
+    if before is not None:
+        statement = statement.where(
+            tuple_(Score.calculated_at, Score.is_total, Score.id) < tuple_(*before)
+        )
+    statement = statement.order_by(
+        Score.calculated_at.desc(), Score.is_total.desc(), Score.id.desc()
+    ).limit(limit)
     return list(session.exec(statement).all())
 
 
@@ -668,6 +831,90 @@ def get_student_latest_total_score(
     return session.exec(statement).first()
 
 
+def get_latest_total_score_value(
+    *,
+    session: Session,
+    student_id: uuid.UUID,
+    exclude_session_id: uuid.UUID | None = None,
+) -> float | None:
+    """Get the value of a student's most recent total score, optionally ignoring a session"""
+    statement = select(Score.score_value).where(
+        Score.student_id == student_id, Score.is_total == True
+    )
+    if exclude_session_id is not None:
+        statement = statement.where(Score.session_id != exclude_session_id)
+    statement = statement.order_by(Score.calculated_at.desc()).limit(1)
+    return session.exec(statement).first()
+
+
+def get_recent_total_scores(
+    *, session: Session, student_id: uuid.UUID, limit: int
+) -> list[float]:
+    """Get the values of a student's most recent total scores, newest first"""
+    statement = (
+        select(Score.score_value)
+        .where(Score.student_id == student_id, Score.is_total == True)
+        .order_by(Score.calculated_at.desc())
+        .limit(limit)
+    )
+    return list(session.exec(statement).all())
+
+
+def get_scored_answer_rows(
+    *, session: Session, student_ids: list[uuid.UUID] | None = None
+) -> list[tuple[uuid.UUID, SurveyCategory, int]]:
+    """Get (session_id, category, answer) of every scored response in completed
+    sessions, without loading the full responses"""
+    statement = (
+        select(
+            SurveyResponse.session_id, SurveyResponse.category, SurveyResponse.answer
+        )
+        .join(SurveySession, SurveyResponse.session_id == SurveySession.id)
+        .where(
+            SurveySession.status == SessionStatus.COMPLETED,
+            SurveyResponse.category.is_not(None),
+        )
+    )
+    if student_ids is not None:
+        statement = statement.where(SurveySession.student_id.in_(student_ids))
+    return [
+        (session_id, SurveyCategory(category), answer)
+        for session_id, category, answer in session.exec(statement).all()
+    ]
+
+
+def get_score_rows(
+    *, session: Session, student_ids: list[uuid.UUID] | None = None
+) -> list[tuple[uuid.UUID, uuid.UUID, uuid.UUID, SurveyCategory | None, bool]]:
+    """Get (id, student_id, session_id, category, is_total) of scores, oldest first"""
+    statement = select(
+        Score.id, Score.student_id, Score.session_id, Score.category, Score.is_total
+    ).order_by(Score.calculated_at, Score.is_total)
+    if student_ids is not None:
+        statement = statement.where(Score.student_id.in_(student_ids))
+    return [
+        (score_id, student_id, session_id, category, is_total)
+        for score_id, student_id, session_id, category, is_total in session.exec(
+            statement
+        ).all()
+    ]
+
+
+def update_scores_bulk(
+    *,
+    session: Session,
+    score_values: list[dict[str, Any]],
+    latest_scores: list[dict[str, Any]],
+) -> None:
+    """Update scores and the students' latest score columns by primary key in
+    one transaction, each as a single executemany UPDATE"""
+    if score_values:
+        session.execute(update(Score), score_values)
+    if latest_scores:
+        session.execute(update(Student), latest_scores)
+    session.commit()
+
+
 def get_session_scores(*, session: Session, session_id: uuid.UUID) -> list[Score]:
     statement = select(Score).where(Score.session_id == session_id)
     return list(session.exec(statement).all())
@@ -734,6 +981,26 @@ def create_notification(
     return db_notification
 
 
+def create_notifications_bulk(
+    *, session: Session, notifications_in: list[NotificationCreate]
+) -> list[Notification]:
+    """
+    Create several notifications with a single commit.
+
+    The commit expires them, so they are reloaded in one query afterwards
+    and stay readable once the session is closed.
+    """
+    db_notifications = [Notification.model_validate(n) for n in notifications_in]
+    if not db_notifications:
+        return db_notifications
+    notification_ids = [n.id for n in db_notifications]
+    session.add_all(db_notifications)
+    session.commit()
+    statement = select(Notification).where(Notification.id.in_(notification_ids))
+    session.exec(statement).all()
+    return db_notifications
+
+
 def get_notification(
     *, session: Session, notification_id: uuid.UUID
 ) -> Notification | None:
@@ -761,6 +1028,50 @@ def get_user_notifications(
     return notifications, count
 
 
+def count_user_notifications_by_type(
+    *, session: Session, user_id: uuid.UUID, unread_only: bool = True
+) -> dict[NotificationType, int]:
+    """Count a user's notifications per type in a single grouped query"""
+    statement = select(Notification.type, func.count()).where(
+        Notification.user_id == user_id
+    )
+    if unread_only:
+        statement = statement.where(Notification.read_at == None)
+    statement = statement.group_by(Notification.type)
+    return {
+        NotificationType(type_): count
+        for type_, count in session.exec(statement).all()
+    }
+
+
+def get_user_notifications_with_student_names(
+    *,
+    session: Session,
+    user_id: uuid.UUID,
+    unread_only: bool = False,
+    skip: int = 0,
+    limit: int = 50,
+) -> tuple[list[tuple[Notification, str | None]], int]:
+    """Get notifications for a user together with the name of the student they concern"""
+    statement = (
+        select(Notification, Student.name)
+        .outerjoin(Student, Notification.student_id == Student.id)
+        .where(Notification.user_id == user_id)
+    )
+
+    if unread_only:
+        statement = statement.where(Notification.read_at == None)
+
+    count_statement = select(func.count()).select_from(statement.subquery())
+    count = session.exec(count_statement).one()
+
+    statement = statement.offset(skip).limit(limit).order_by(Notification.sent_at.desc())
+    rows: list[tuple[Notification, str | None]] = [
+        (notification, name) for notification, name in session.exec(statement).all()
+    ]
+    return rows, count
+
+
 def mark_notification_read(
     *, session: Session, db_notification: Notification
 ) -> Notification:
@@ -823,46 +1134,89 @@ def get_audit_logs(
 # =============================================================================
 
 
+# Row returned by _students_with_latest_scores_statement, in column order
+_StudentWithLatestScoreRow = tuple[
+    uuid.UUID,
+    str,
+    str,
+    str,
+    StudentPhase,
+    bool,
+    StudentStatus,
+    datetime | None,
+    datetime,
+    float | None,
+    ScoreColor | None,
+    datetime | None,
+]
+
+
+def _students_with_latest_scores_statement(
+    user_id: uuid.UUID | None,
+) -> Select[_StudentWithLatestScoreRow]:
+    """
+    Build a SELECT returning exactly the StudentWithLatestScore columns.
+
+    The latest total score is denormalized onto Student, so this reads the
+    student table alone without joining scores.
+    """
+    statement: Select[_StudentWithLatestScoreRow] = select(
+        Student.id,
+        Student.internal_id,
+        Student.name,
+        Student.email,
+        Student.phase,
+        Student.consent_status,
+        Student.status,
+        Student.consent_date,
+        Student.created_at,
+        Student.latest_score,
+        Student.latest_color,
+        Student.last_response_date,
+    ).where(Student.status == StudentStatus.ACTIVE)
+
+    if user_id:
+        # Only students assigned to this user
+        statement = statement.join(
+            StudentAssignment, Student.id == StudentAssignment.student_id
+        ).where(StudentAssignment.user_id == user_id)
+
+    return statement
+
+
+def _exec_students_with_latest_scores(
+    *, session: Session, statement: Select[_StudentWithLatestScoreRow]
+) -> list[StudentWithLatestScore]:
+    """Run a _students_with_latest_scores_statement query"""
+    columns = statement.selected_columns.keys()
+    # Rows come straight from the database, so skip per-row validation
+    rows: list[dict[str, Any]] = [
+        dict(zip(columns, row, strict=True)) for row in session.exec(statement).all()
+    ]
+    return [StudentWithLatestScore.model_construct(**values) for values in rows]
+
+
 def get_students_with_latest_scores(
     *,
     session: Session,
     user_id: uuid.UUID | None = None,
-) -> list[tuple[Student, Score | None]]:
+) -> list[StudentWithLatestScore]:
     """
     Get all students (or assigned students if user_id provided) with their latest total score
     """
-    if user_id:
-        # Get students assigned to this user
-        student_statement = (
-            select(Student)
-            .join(StudentAssignment, Student.id == StudentAssignment.student_id)
-            .where(StudentAssignment.user_id == user_id)
-            .where(Student.status == StudentStatus.ACTIVE)
-        )
-    else:
-        student_statement = select(Student).where(Student.status == StudentStatus.ACTIVE)
-
-    students = list(session.exec(student_statement).all())
-
-    result = []
-    for student in students:
-        latest_score = get_student_latest_total_score(session=session, student_id=student.id)
-        result.append((student, latest_score))
-
-    return result
+    statement = _students_with_latest_scores_statement(user_id)
+    return _exec_students_with_latest_scores(session=session, statement=statement)
 
 
 def get_high_risk_students(
     *,
     session: Session,
     user_id: uuid.UUID | None = None,
-) -> list[tuple[Student, Score]]:
+) -> list[StudentWithLatestScore]:
     """
     Get students with red scores (high risk)
     """
-    students_with_scores = get_students_with_latest_scores(session=session, user_id=user_id)
-    return [
-        (student, score)
-        for student, score in students_with_scores
-        if score and score.color == ScoreColor.RED
-    ]
+    statement = _students_with_latest_scores_statement(user_id).where(
+        Student.latest_color == ScoreColor.RED
+    )
+    return _exec_students_with_latest_scores(session=session, statement=statement)
@@ -1,9 +1,33 @@
+import os
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
 
 from pydantic import EmailStr
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, Field, Index, Relationship, SQLModel
+from sqlmodel._compat import SQLModelConfig
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The 48-bit millisecond timestamp prefix makes new rows land at the tail of
+    the primary key index instead of on random pages like uuid4 does.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # Set version (7) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
 
 
 # =============================================================================
@@ -93,6 +117,7 @@ class NotificationType(str, Enum):
 
     CRITICAL_SCORE = "critical_score"
     SCORE_DROP = "score_drop"
+    CRITICAL_SCORE_DROP = "critical_score_drop"  # Both of the above at once
     NON_RESPONSE = "non_response"
     WEEKLY_SUMMARY = "weekly_summary"
 
@@ -171,7 +196,7 @@ class UsersPublic(SQLModel):
 
 class StudentBase(SQLModel):
     name: str = Field(max_length=255)
-    email: EmailStr = Field(max_length=255, index=True)
+    email: EmailStr = Field(max_length=255)
     phase: StudentPhase = Field(default=StudentPhase.INDSLUSNING)
     consent_status: bool = Field(default=False)
     status: StudentStatus = Field(default=StudentStatus.ACTIVE)
@@ -190,7 +215,7 @@ class StudentUpdate(SQLModel):
 
 
 class Student(StudentBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     internal_id: str = Field(
         default_factory=lambda: f"STU-{uuid.uuid4().hex[:8].upper()}",
         max_length=20,
@@ -205,6 +230,10 @@ class Student(StudentBase, table=True):
         description="Token for opt-out consent link",
     )
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Latest total score, denormalized for dashboard reads (see crud.update_student_latest_score)
+    latest_score: float | None = Field(default=None)
+    latest_color: ScoreColor | None = Field(default=None)
+    last_response_date: datetime | None = Field(default=None)
     # Relationships
     assignments: list["StudentAssignment"] = Relationship(
         back_populates="student", cascade_delete=True
@@ -224,7 +253,24 @@ class Student(StudentBase, table=True):
     )
 
 
+# Partial index over active students only, so active-student scans stay flat
+# as inactive students accumulate over the years
+Index(
+    "ix_student_active",
+    Student.id,
+    postgresql_where=Student.status == StudentStatus.ACTIVE,
+)
+
+# Email lookups are either by email alone (duplicate checks across all
+# statuses) or by email among active students; leading with email keeps the
+# first an index seek while the second is answered without a heap filter
+Index("ix_student_email_status", Student.email, Student.status)
+
+
 class StudentPublic(StudentBase):
+    # Output-only, so instances are frozen
+    model_config = SQLModelConfig(frozen=True)
+
     id: uuid.UUID
     internal_id: str
     consent_date: datetime | None
@@ -398,7 +444,7 @@ class SurveySessionCreate(SurveySessionBase):
 
 
 class SurveySession(SurveySessionBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     student_id: uuid.UUID = Field(foreign_key="student.id", ondelete="CASCADE")
     token: str = Field(
         default_factory=lambda: uuid.uuid4().hex, max_length=64, unique=True, index=True
@@ -408,7 +454,9 @@ class SurveySession(SurveySessionBase, table=True):
     sent_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: datetime | None = Field(default=None)
     reminder_count: int = Field(default=0)
-    custom_questions: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    # At most two custom questions per session, stored as plain columns
+    custom_question_0: str | None = Field(default=None)
+    custom_question_1: str | None = Field(default=None)
     # Relationships
     student: Student = Relationship(back_populates="survey_sessions")
     responses: list["SurveyResponse"] = Relationship(
@@ -416,6 +464,28 @@ class SurveySession(SurveySessionBase, table=True):
     )
     scores: list["Score"] = Relationship(back_populates="session", cascade_delete=True)
 
+    @property
+    def custom_questions(self) -> list[str] | None:
+        questions = [
+            q for q in (self.custom_question_0, self.custom_question_1) if q is not None
+        ]
+        return questions or None
+
+
+# Expiry and reminder sweeps filter on status and token expiry, and a
+# student's history is read newest week first
+Index(
+    "ix_surveysession_status_token_expires_at",
+    SurveySession.status,
+    SurveySession.token_expires_at,
+)
+Index(
+    "ix_surveysession_student_id_year_week",
+    SurveySession.student_id,
+    SurveySession.year,
+    SurveySession.week_number,
+)
+
 
 class SurveySessionPublic(SurveySessionBase):
     id: uuid.UUID
@@ -460,12 +530,15 @@ class SurveyResponseBulkCreate(SQLModel):
 
 
 class SurveyResponse(SurveyResponseBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     session_id: uuid.UUID = Field(foreign_key="surveysession.id", ondelete="CASCADE")
     question_id: uuid.UUID | None = Field(
         default=None, foreign_key="surveyquestion.id", ondelete="CASCADE"
     )
     custom_question_index: int | None = Field(default=None, ge=0, le=1)
+    # Category of the answered question, copied at insert so scoring needs no
+    # question lookup. None for custom question responses.
+    category: SurveyCategory | None = Field(default=None)
     answered_at: datetime = Field(default_factory=datetime.utcnow)
     # Relationships
     session: SurveySession = Relationship(back_populates="responses")
@@ -511,7 +584,7 @@ class ScoreBase(SQLModel):
 
 
 class Score(ScoreBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     student_id: uuid.UUID = Field(foreign_key="student.id", ondelete="CASCADE")
     session_id: uuid.UUID = Field(foreign_key="surveysession.id", ondelete="CASCADE")
     calculated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -520,7 +593,29 @@ class Score(ScoreBase, table=True):
     session: SurveySession = Relationship(back_populates="scores")
 
 
+# Previous-score and trend lookups read a student's newest total scores and
+# are answered from the index alone
+Index(
+    "ix_score_student_id_is_total_calculated_at",
+    Score.student_id,
+    Score.is_total,
+    Score.calculated_at,
+    postgresql_include=["score_value", "session_id"],
+)
+# Score history pages through a student's scores newest first by keyset
+Index(
+    "ix_score_student_id_calculated_at_is_total_id",
+    Score.student_id,
+    Score.calculated_at,
+    Score.is_total,
+    Score.id,
+)
+
+
 class ScorePublic(ScoreBase):
+    # Output-only, so instances are frozen
+    model_config = SQLModelConfig(frozen=True)
+
     id: uuid.UUID
     student_id: uuid.UUID
     session_id: uuid.UUID
@@ -530,6 +625,8 @@ class ScorePublic(ScoreBase):
 class ScoresPublic(SQLModel):
     data: list[ScorePublic]
     count: int
+    # Opaque cursor for the next page, None on the last page
+    next_cursor: str | None = None
 
 
 class ScoreHistory(SQLModel):
@@ -608,6 +705,17 @@ class Notification(NotificationBase, table=True):
     user: User = Relationship(back_populates="notifications")
 
 
+# Unread counts per type only touch the unread part of a user's notifications,
+# while the alert list pages through all of them newest first
+Index(
+    "ix_notification_user_id_type_unread",
+    Notification.user_id,
+    Notification.type,
+    postgresql_where=Notification.read_at.is_(None),
+)
+Index("ix_notification_user_id_sent_at", Notification.user_id, Notification.sent_at)
+
+
 class NotificationPublic(NotificationBase):
     id: uuid.UUID
     student_id: uuid.UUID | None
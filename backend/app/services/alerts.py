@@ -8,12 +8,15 @@ Alert triggers:
 """
 
 import logging
+import threading
 import uuid
-from datetime import datetime
+from collections import defaultdict
 
+from cachetools import TTLCache
 from sqlmodel import Session
 
 from app import crud
+from app.core.db import engine
 from app.models import (
     Notification,
     NotificationCreate,
@@ -22,12 +25,50 @@ from app.models import (
     ScoreColor,
     SessionStatus,
     Student,
+    StudentAssignment,
     SurveySession,
 )
 from app.services.scoring import detect_score_drop, get_previous_total_score
 
 logger = logging.getLogger(__name__)
 
+# Number of recent sessions inspected when counting consecutive non-responses
+RECENT_SESSIONS_LIMIT = 5
+
+# Alert summary buckets per notification type; other types count as "other"
+SUMMARY_KEYS = {
+    NotificationType.CRITICAL_SCORE: ("critical_score",),
+    NotificationType.SCORE_DROP: ("score_drop",),
+    NotificationType.CRITICAL_SCORE_DROP: ("critical_score", "score_drop"),
+    NotificationType.NON_RESPONSE: ("non_response",),
+}
+
+# Per-mentor alert summaries are cached briefly since the dashboard asks for
+# them on every page load. Entries are invalidated when a mentor's
+# notifications change in this process; the TTL bounds staleness otherwise.
+_alert_summary_cache: TTLCache[uuid.UUID, dict[str, int]] = TTLCache(
+    maxsize=1024, ttl=30
+)
+_alert_summary_lock = threading.Lock()
+
+
+def invalidate_alert_summary(user_id: uuid.UUID) -> None:
+    """Drop the cached alert summary for a mentor."""
+    with _alert_summary_lock:
+        _alert_summary_cache.pop(user_id, None)
+
+
+def _create_notifications(
+    *, db_session: Session, notifications_in: list[NotificationCreate]
+) -> list[Notification]:
+    """Insert notifications and invalidate the affected mentors' summaries."""
+    notifications = crud.create_notifications_bulk(
+        session=db_session, notifications_in=notifications_in
+    )
+    for user_id in {n.user_id for n in notifications_in}:
+        invalidate_alert_summary(user_id)
+    return notifications
+
 
 async def check_for_alerts(
     *,
@@ -52,7 +93,39 @@ async def check_for_alerts(
     Returns:
         List of created notifications
     """
-    notifications: list[Notification] = []
+    # Find the red scores, their categories and the total score in one pass
+    has_red_score = False
+    red_categories: list[str] = []
+    total_score: Score | None = None
+    for score in scores:
+        if score.color == ScoreColor.RED:
+            has_red_score = True
+            if score.category:
+                red_categories.append(score.category.value)
+        if score.is_total:
+            total_score = score
+
+    # Check for a score drop from the previous session
+    drop_message: str | None = None
+    if total_score:
+        previous_score = get_previous_total_score(
+            db_session=db_session,
+            student_id=student.id,
+            exclude_session_id=survey_session.id,
+        )
+        if previous_score is not None and detect_score_drop(
+            total_score.score_value, previous_score
+        ):
+            drop_amount = round(previous_score - total_score.score_value, 1)
+            drop_message = (
+                f"Elevens trivselsscore er faldet med {drop_amount} point "
+                f"(fra {previous_score} til {total_score.score_value})."
+            )
+    has_score_drop = drop_message is not None
+
+    # Most completions raise no alert, so mentors are only looked up when needed
+    if not has_red_score and not has_score_drop:
+        return []
 
     # Get mentors assigned to this student
     assignments = crud.get_student_assignments(
@@ -60,144 +133,166 @@ async def check_for_alerts(
     )
 
     if not assignments:
-        logger.warning(f"No mentors assigned to student {student.id}")
-        return notifications
-
-    # Check for critical (red) scores
-    red_scores = [s for s in scores if s.color == ScoreColor.RED]
-    if red_scores:
-        # Get total score for the message
-        total_score = next((s for s in scores if s.is_total), None)
-        score_value = total_score.score_value if total_score else "N/A"
+        logger.warning("No mentors assigned to student %s", student.id)
+        return []
+
+    messages: list[str] = []
 
-        # Find which categories are red
-        red_categories = [s.category.value for s in red_scores if s.category]
+    # Critical (red) scores
+    if has_red_score:
+        score_value = total_score.score_value if total_score else "N/A"
 
         message = f"Eleven har en kritisk trivselsscore på {score_value}."
         if red_categories:
             message += f" Kritiske kategorier: {', '.join(red_categories)}."
-
-        # Create notification for each assigned mentor
-        for assignment in assignments:
-            notification = crud.create_notification(
-                session=db_session,
-                notification_in=NotificationCreate(
-                    student_id=student.id,
-                    user_id=assignment.user_id,
-                    type=NotificationType.CRITICAL_SCORE,
-                    title=f"Kritisk score: {student.name}",
-                    message=message,
-                ),
-            )
-            notifications.append(notification)
-            logger.info(
-                f"Created critical score alert for student {student.id} "
-                f"to mentor {assignment.user_id}"
-            )
-
-    # Check for score drop
-    total_score = next((s for s in scores if s.is_total), None)
-    if total_score:
-        previous_score = get_previous_total_score(
-            db_session=db_session,
+        messages.append(message)
+
+    # Score drop
+    if drop_message:
+        messages.append(drop_message)
+
+    # A critical score that is also a drop is sent as one combined alert, so
+    # each mentor gets a single notification per session
+    if has_red_score and has_score_drop:
+        notification_type = NotificationType.CRITICAL_SCORE_DROP
+        title = f"Kritisk score og fald i trivsel: {student.name}"
+    elif has_red_score:
+        notification_type = NotificationType.CRITICAL_SCORE
+        title = f"Kritisk score: {student.name}"
+    else:
+        notification_type = NotificationType.SCORE_DROP
+        title = f"Fald i trivsel: {student.name}"
+
+    pending = [
+        NotificationCreate(
             student_id=student.id,
-            exclude_session_id=survey_session.id,
+            user_id=assignment.user_id,
+            type=notification_type,
+            title=title,
+            message=" ".join(messages),
         )
+        for assignment in assignments
+    ]
+    logger.info(
+        "Queued %s alert for student %s to %d mentor(s)",
+        notification_type.value,
+        student.id,
+        len(assignments),
+    )
 
-        if detect_score_drop(total_score.score_value, previous_score):
-            drop_amount = round(previous_score - total_score.score_value, 1)
-            message = (
-                f"Elevens trivselsscore er faldet med {drop_amount} point "
-                f"(fra {previous_score} til {total_score.score_value})."
-            )
-
-            for assignment in assignments:
-                notification = crud.create_notification(
-                    session=db_session,
-                    notification_in=NotificationCreate(
-                        student_id=student.id,
-                        user_id=assignment.user_id,
-                        type=NotificationType.SCORE_DROP,
-                        title=f"Fald i trivsel: {student.name}",
-                        message=message,
-                    ),
-                )
-                notifications.append(notification)
-                logger.info(
-                    f"Created score drop alert for student {student.id} "
-                    f"to mentor {assignment.user_id}"
-                )
-
-    return notifications
+    return _create_notifications(db_session=db_session, notifications_in=pending)
 
 
-async def process_non_response(
+async def check_for_alerts_in_background(
     *,
-    db_session: Session,
-    survey_session: SurveySession,
-    student: Student,
-) -> list[Notification]:
+    survey_session_id: uuid.UUID,
+    student_id: uuid.UUID,
+) -> None:
     """
-    Create alerts for non-response after survey expiry.
+    Run check_for_alerts for a completed survey outside the request.
 
-    "Non-respons er også et svar" - non-response should trigger attention.
+    Meant to be scheduled as a background task once the submission has been
+    saved, so the student's response doesn't wait on alert processing. The
+    request's database session is closed by then, so a new one is opened.
 
     Args:
-        db_session: Database session
-        survey_session: The expired survey session
-        student: The student who didn't respond
-
-    Returns:
-        List of created notifications
+        survey_session_id: ID of the completed survey session
+        student_id: ID of the student who completed the survey
     """
-    notifications: list[Notification] = []
+    with Session(engine) as db_session:
+        survey_session = crud.get_survey_session(
+            session=db_session, session_id=survey_session_id
+        )
+        student = crud.get_student(session=db_session, student_id=student_id)
+        if not survey_session or not student:
+            logger.warning(
+                "Skipping alert check for missing session %s", survey_session_id
+            )
+            return
 
-    # Get mentors assigned to this student
-    assignments = crud.get_student_assignments(
-        session=db_session, student_id=student.id
-    )
+        scores = crud.get_session_scores(
+            session=db_session, session_id=survey_session_id
+        )
+        try:
+            await check_for_alerts(
+                db_session=db_session,
+                survey_session=survey_session,
+                scores=scores,
+                student=student,
+            )
+        except Exception:
+            logger.exception("Alert check failed for session %s", survey_session_id)
 
-    if not assignments:
-        logger.warning(f"No mentors assigned to student {student.id}")
-        return notifications
 
-    # Count consecutive non-responses
-    recent_sessions = crud.get_student_sessions(
-        session=db_session,
-        student_id=student.id,
-        limit=5,
-    )
+def count_consecutive_non_responses(
+    sessions: list[SurveySession],
+    *,
+    year: int,
+    week_number: int,
+    non_response_ids: set[uuid.UUID],
+) -> int:
+    """
+    Count the unanswered weeks in a row up to and including a given week.
+
+    Args:
+        sessions: The student's recent sessions, in any order
+        year: Year of the week the streak ends in
+        week_number: Week number of the week the streak ends in
+        non_response_ids: Sessions to count as unanswered whatever their
+            stored status, e.g. those being expired together
+
+    Returns:
+        Number of consecutive unanswered sessions ending at the given week
+    """
     consecutive_non_responses = 0
-    for sess in recent_sessions:
-        if sess.status in [SessionStatus.NON_RESPONSE, SessionStatus.EXPIRED]:
+    for sess in sorted(
+        sessions, key=lambda sess: (sess.year, sess.week_number), reverse=True
+    ):
+        if (sess.year, sess.week_number) > (year, week_number):
+            continue
+        if sess.id in non_response_ids or sess.status in [
+            SessionStatus.NON_RESPONSE,
+            SessionStatus.EXPIRED,
+        ]:
             consecutive_non_responses += 1
         else:
             break
+    return consecutive_non_responses
 
-    message = (
-        f"Eleven har ikke besvaret trivselstjekket for uge {survey_session.week_number}."
-    )
+
+def build_non_response_notifications(
+    *,
+    week_number: int,
+    student: Student,
+    assignments: list[StudentAssignment],
+    consecutive_non_responses: int,
+) -> list[NotificationCreate]:
+    """
+    Build the non-response notifications for each assigned mentor.
+
+    Args:
+        week_number: Week number of the expired survey session
+        student: The student who didn't respond
+        assignments: The student's mentor assignments
+        consecutive_non_responses: Unanswered weeks in a row, this one included
+
+    Returns:
+        One notification per assigned mentor
+    """
+    message = f"Eleven har ikke besvaret trivselstjekket for uge {week_number}."
     if consecutive_non_responses > 1:
         message += f" Dette er {consecutive_non_responses}. uge i træk uden svar."
 
-    for assignment in assignments:
-        notification = crud.create_notification(
-            session=db_session,
-            notification_in=NotificationCreate(
-                student_id=student.id,
-                user_id=assignment.user_id,
-                type=NotificationType.NON_RESPONSE,
-                title=f"Manglende besvarelse: {student.name}",
-                message=message,
-            ),
-        )
-        notifications.append(notification)
-        logger.info(
-            f"Created non-response alert for student {student.id} "
-            f"to mentor {assignment.user_id}"
+    return [
+        NotificationCreate(
+            student_id=student.id,
+            user_id=assignment.user_id,
+            type=NotificationType.NON_RESPONSE,
+            title=f"Manglende besvarelse: {student.name}",
+            message=message,
         )
-
-    return notifications
+        for assignment in assignments
+    ]
 
 
 async def process_expired_sessions(*, db_session: Session) -> int:
@@ -213,40 +308,80 @@ async def process_expired_sessions(*, db_session: Session) -> int:
     Returns:
         Number of sessions processed
     """
-    expired_sessions = crud.get_expired_sessions(session=db_session)
-    processed_count = 0
-
-    for survey_session in expired_sessions:
-        # Update session status to non_response
-        crud.update_session_status(
-            session=db_session,
-            db_session=survey_session,
-            status=SessionStatus.NON_RESPONSE,
-        )
+    # Only the few columns needed are loaded for the expired sessions
+    expired_sessions = crud.get_expired_session_rows(session=db_session)
+    if not expired_sessions:
+        return 0
 
-        # Get the student
-        student = crud.get_student(session=db_session, student_id=survey_session.student_id)
+    session_ids = [session_id for session_id, _, _, _ in expired_sessions]
+    student_ids = list({student_id for _, student_id, _, _ in expired_sessions})
+
+    # Update all expired sessions to non_response in one statement
+    crud.update_sessions_status_bulk(
+        session=db_session,
+        session_ids=session_ids,
+        status=SessionStatus.NON_RESPONSE,
+    )
+
+    # Prefetch students, assignments and recent sessions for all of them
+    students_by_id = {
+        student.id: student
+        for student in crud.get_students_by_ids(
+            session=db_session, student_ids=student_ids
+        )
+    }
+    assignments_by_student: dict[uuid.UUID, list[StudentAssignment]] = defaultdict(list)
+    for assignment in crud.get_assignments_for_students(
+        session=db_session, student_ids=student_ids
+    ):
+        assignments_by_student[assignment.student_id].append(assignment)
+    sessions_by_student: dict[uuid.UUID, list[SurveySession]] = defaultdict(list)
+    for sess in crud.get_recent_sessions_for_students(
+        session=db_session, student_ids=student_ids, limit=RECENT_SESSIONS_LIMIT
+    ):
+        sessions_by_student[sess.student_id].append(sess)
+
+    # Build notifications for every session, then insert them together. Each
+    # streak ends at its own week and counts every session expired in this
+    # run, so weeks expiring together see each other.
+    expired_ids = set(session_ids)
+    pending: list[NotificationCreate] = []
+    for session_id, student_id, year, week_number in expired_sessions:
+        student = students_by_id.get(student_id)
         if student:
-            await process_non_response(
-                db_session=db_session,
-                survey_session=survey_session,
-                student=student,
+            assignments = assignments_by_student[student.id]
+            if not assignments:
+                logger.warning("No mentors assigned to student %s", student.id)
+            pending.extend(
+                build_non_response_notifications(
+                    week_number=week_number,
+                    student=student,
+                    assignments=assignments,
+                    consecutive_non_responses=count_consecutive_non_responses(
+                        sessions_by_student[student.id],
+                        year=year,
+                        week_number=week_number,
+                        non_response_ids=expired_ids,
+                    ),
+                )
             )
+        logger.info("Processed expired session %s", session_id)
 
-        processed_count += 1
-        logger.info(f"Processed expired session {survey_session.id}")
+    _create_notifications(db_session=db_session, notifications_in=pending)
 
-    return processed_count
+    return len(expired_sessions)
 
 
 def get_alert_summary_for_mentor(
     *,
     db_session: Session,
     user_id: uuid.UUID,
-) -> dict:
+) -> dict[str, int]:
     """
     Get a summary of alerts for a mentor.
 
+    Summaries are served from a short-lived in-process cache.
+
     Args:
         db_session: Database session
         user_id: Mentor's user ID
@@ -254,29 +389,27 @@ def get_alert_summary_for_mentor(
     Returns:
         Dictionary with alert counts by type
     """
-    notifications, total_count = crud.get_user_notifications(
-        session=db_session,
-        user_id=user_id,
-        unread_only=True,
-        limit=100,
+    with _alert_summary_lock:
+        cached = _alert_summary_cache.get(user_id)
+    if cached is not None:
+        return dict(cached)
+
+    counts = crud.count_user_notifications_by_type(
+        session=db_session, user_id=user_id, unread_only=True
     )
 
     summary = {
-        "total_unread": total_count,
+        "total_unread": sum(counts.values()),
         "critical_score": 0,
         "score_drop": 0,
         "non_response": 0,
         "other": 0,
     }
 
-    for notification in notifications:
-        if notification.type == NotificationType.CRITICAL_SCORE:
-            summary["critical_score"] += 1
-        elif notification.type == NotificationType.SCORE_DROP:
-            summary["score_drop"] += 1
-        elif notification.type == NotificationType.NON_RESPONSE:
-            summary["non_response"] += 1
-        else:
-            summary["other"] += 1
+    for notification_type, count in counts.items():
+        for key in SUMMARY_KEYS.get(notification_type, ("other",)):
+            summary[key] += count
 
-    return summary
+    with _alert_summary_lock:
+        _alert_summary_cache[user_id] = summary
+    return dict(summary)
@@ -14,7 +14,12 @@ Color thresholds (configurable):
 """
 
 import uuid
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Iterable
+from itertools import accumulate
+from statistics import fmean
+from typing import Any
 
 from sqlmodel import Session
 
@@ -22,12 +27,28 @@ from app import crud
 from app.core.config import settings
 from app.models import (
     Score,
+    ScoreBase,
     ScoreColor,
     SurveyCategory,
     SurveyResponse,
     SurveySession,
 )
 
+# Categories in a fixed order, so answers can be summed into small
+# fixed-size lists indexed by category instead of grouped into lists
+CATEGORIES: tuple[SurveyCategory, ...] = tuple(SurveyCategory)
+CATEGORY_INDEX: dict[SurveyCategory, int] = {
+    category: index for index, category in enumerate(CATEGORIES)
+}
+
+# Color thresholds in ascending order and the color of each band they bound,
+# so a score's color is the band its position in the thresholds points at
+_COLOR_THRESHOLDS = (settings.SCORE_YELLOW_MIN, settings.SCORE_GREEN_MIN)
+_COLOR_BANDS = (ScoreColor.RED, ScoreColor.YELLOW, ScoreColor.GREEN)
+
+# Minimum change between the recent and older half averages to count as a trend
+TREND_THRESHOLD = 0.3
+
 
 def determine_color(score: float) -> ScoreColor:
     """
@@ -39,18 +60,12 @@ def determine_color(score: float) -> ScoreColor:
     Returns:
         ScoreColor enum value (GREEN, YELLOW, or RED)
     """
-    if score >= settings.SCORE_GREEN_MIN:
-        return ScoreColor.GREEN
-    elif score >= settings.SCORE_YELLOW_MIN:
-        return ScoreColor.YELLOW
-    else:
-        return ScoreColor.RED
+    return _COLOR_BANDS[bisect_right(_COLOR_THRESHOLDS, score)]
 
 
 def calculate_category_score(
     responses: list[SurveyResponse],
     category: SurveyCategory,
-    session: Session,
 ) -> float | None:
     """
     Calculate the average score for a specific category.
@@ -58,22 +73,16 @@ def calculate_category_score(
     Args:
         responses: List of survey responses
         category: The category to calculate score for
-        session: Database session for fetching question data
 
     Returns:
         Average score for the category, or None if no responses for that category
     """
-    category_responses = []
-
-    for response in responses:
-        question = crud.get_question(session=session, question_id=response.question_id)
-        if question and question.category == category:
-            category_responses.append(response.answer)
+    category_responses = [r.answer for r in responses if r.category == category]
 
     if not category_responses:
         return None
 
-    return sum(category_responses) / len(category_responses)
+    return fmean(category_responses)
 
 
 def calculate_total_score(category_scores: dict[SurveyCategory, float]) -> float:
@@ -86,39 +95,40 @@ def calculate_total_score(category_scores: dict[SurveyCategory, float]) -> float
     Returns:
         Average of all category scores
     """
-    scores = list(category_scores.values())
-    if not scores:
+    if not category_scores:
         return 0.0
-    return sum(scores) / len(scores)
+    return fmean(category_scores.values())
 
 
-def calculate_all_scores(
-    responses: list[SurveyResponse],
-    session: Session,
+def compute_scores(
+    answers: Iterable[tuple[SurveyCategory | None, int]],
 ) -> tuple[dict[SurveyCategory, float], float]:
     """
-    Calculate all category scores and total score.
+    Calculate all category scores and total score from (category, answer) pairs.
 
     Args:
-        responses: List of survey responses
-        session: Database session
+        answers: Category and answer of each response; the category is None
+            for custom question responses, which are not scored
 
     Returns:
         Tuple of (category_scores dict, total_score)
     """
-    # Group responses by category
-    category_answers: dict[SurveyCategory, list[int]] = defaultdict(list)
+    # Sum answers per category
+    sums = [0] * len(CATEGORIES)
+    counts = [0] * len(CATEGORIES)
 
-    for response in responses:
-        question = crud.get_question(session=session, question_id=response.question_id)
-        if question:
-            category_answers[question.category].append(response.answer)
+    for category, answer in answers:
+        if category:
+            index = CATEGORY_INDEX[category]
+            sums[index] += answer
+            counts[index] += 1
 
     # Calculate category scores
-    category_scores: dict[SurveyCategory, float] = {}
-    for category, answers in category_answers.items():
-        if answers:
-            category_scores[category] = sum(answers) / len(answers)
+    category_scores: dict[SurveyCategory, float] = {
+        category: sums[index] / counts[index]
+        for index, category in enumerate(CATEGORIES)
+        if counts[index]
+    }
 
     # Calculate total score
     total_score = calculate_total_score(category_scores)
@@ -126,6 +136,23 @@ def calculate_all_scores(
     return category_scores, total_score
 
 
+def calculate_all_scores(
+    responses: list[SurveyResponse],
+) -> tuple[dict[SurveyCategory, float], float]:
+    """
+    Calculate all category scores and total score.
+
+    Args:
+        responses: List of survey responses
+
+    Returns:
+        Tuple of (category_scores dict, total_score)
+    """
+    if not responses:
+        return {}, 0.0
+    return compute_scores((r.category, r.answer) for r in responses)
+
+
 def detect_score_drop(
     current_score: float,
     previous_score: float | None,
@@ -164,40 +191,109 @@ def save_scores_for_session(
         responses: List of survey responses
 
     Returns:
-        List of created Score objects
+        List of created Score objects, empty if no response could be scored
     """
-    category_scores, total_score = calculate_all_scores(responses, db_session)
+    category_scores, total_score = calculate_all_scores(responses)
 
-    created_scores: list[Score] = []
+    # Nothing to score, e.g. an aborted session or only custom questions
+    if not category_scores:
+        return []
 
-    # Save category scores
-    for category, score_value in category_scores.items():
-        color = determine_color(score_value)
-        score = crud.create_score(
-            session=db_session,
-            student_id=survey_session.student_id,
-            session_id=survey_session.id,
+    scores = [
+        ScoreBase(
             category=category,
             score_value=round(score_value, 2),
-            color=color,
-            is_total=False,
+            color=determine_color(score_value),
         )
-        created_scores.append(score)
+        for category, score_value in category_scores.items()
+    ]
+    scores.append(
+        ScoreBase(
+            category=None,
+            score_value=round(total_score, 2),
+            color=determine_color(total_score),
+            is_total=True,
+        )
+    )
 
-    # Save total score
-    total_color = determine_color(total_score)
-    total_score_obj = crud.create_score(
+    return crud.create_scores_bulk(
         session=db_session,
         student_id=survey_session.student_id,
         session_id=survey_session.id,
-        category=None,
-        score_value=round(total_score, 2),
-        color=total_color,
-        is_total=True,
+        scores=scores,
     )
-    created_scores.append(total_score_obj)
 
-    return created_scores
+
+def rescore_students(
+    *,
+    db_session: Session,
+    student_ids: list[uuid.UUID] | None = None,
+) -> int:
+    """
+    Recalculate stored scores from the saved responses.
+
+    Meant to be run after the scoring rules or color thresholds change. All
+    responses and scores are read with one query each and the new values and
+    colors are written back in a single transaction.
+
+    Args:
+        db_session: Database session
+        student_ids: Only rescore these students; all if not given
+
+    Returns:
+        Number of survey sessions rescored
+    """
+    answers_by_session: dict[uuid.UUID, list[tuple[SurveyCategory, int]]] = (
+        defaultdict(list)
+    )
+    for session_id, answer_category, answer in crud.get_scored_answer_rows(
+        session=db_session, student_ids=student_ids
+    ):
+        answers_by_session[session_id].append((answer_category, answer))
+
+    session_scores = {
+        session_id: compute_scores(answers)
+        for session_id, answers in answers_by_session.items()
+    }
+
+    score_values: list[dict[str, Any]] = []
+    latest_scores: dict[uuid.UUID, dict[str, Any]] = {}
+    # Rows come oldest first, so the last total seen per student is the latest
+    for score_id, student_id, session_id, category, is_total in crud.get_score_rows(
+        session=db_session, student_ids=student_ids
+    ):
+        category_scores, total_score = session_scores.get(session_id, ({}, None))
+        if is_total:
+            value = total_score
+        elif category is not None:
+            value = category_scores.get(category)
+        else:
+            continue
+        if value is None:
+            # A newer total that is left as is keeps the student's latest score
+            if is_total:
+                latest_scores.pop(student_id, None)
+            continue
+
+        values = {
+            "id": score_id,
+            "score_value": round(value, 2),
+            "color": determine_color(value),
+        }
+        score_values.append(values)
+        if is_total:
+            latest_scores[student_id] = {
+                "id": student_id,
+                "latest_score": values["score_value"],
+                "latest_color": values["color"],
+            }
+
+    crud.update_scores_bulk(
+        session=db_session,
+        score_values=score_values,
+        latest_scores=list(latest_scores.values()),
+    )
+    return len(session_scores)
 
 
 def get_previous_total_score(
@@ -217,18 +313,38 @@ def get_previous_total_score(
     Returns:
         Previous total score or None if no previous score exists
     """
-    scores = crud.get_student_scores(
+    return crud.get_latest_total_score_value(
         session=db_session,
         student_id=student_id,
-        limit=10,
+        exclude_session_id=exclude_session_id,
     )
 
-    # Find the latest total score that's not from the excluded session
-    for score in scores:
-        if score.is_total and score.session_id != exclude_session_id:
-            return score.score_value
 
-    return None
+def determine_trend(total_scores: list[float]) -> str:
+    """
+    Determine the trend of total scores by comparing the recent half to the older half.
+
+    Args:
+        total_scores: Total scores, most recent first
+
+    Returns:
+        "improving", "declining", or "stable"
+    """
+    if len(total_scores) < 2:
+        return "stable"
+
+    # Running sums give both halves from one pass without slicing
+    cumulative = list(accumulate(total_scores))
+    mid = len(total_scores) // 2
+    recent_sum = cumulative[mid - 1]
+    recent_avg = recent_sum / mid
+    older_avg = (cumulative[-1] - recent_sum) / (len(total_scores) - mid)
+
+    if recent_avg - older_avg > TREND_THRESHOLD:
+        return "improving"
+    elif older_avg - recent_avg > TREND_THRESHOLD:
+        return "declining"
+    return "stable"
 
 
 def analyze_score_trend(
@@ -251,15 +367,12 @@ def analyze_score_trend(
         - trend: "improving", "declining", or "stable"
         - average: average score over period
     """
-    scores = crud.get_student_scores(
+    total_scores = crud.get_recent_total_scores(
         session=db_session,
         student_id=student_id,
-        limit=num_weeks * 6,  # Roughly 6 scores per session (5 categories + 1 total)
+        limit=num_weeks,
     )
 
-    # Extract just total scores
-    total_scores = [s.score_value for s in scores if s.is_total][:num_weeks]
-
     if not total_scores:
         return {
             "scores": [],
@@ -267,23 +380,8 @@ def analyze_score_trend(
             "average": 0.0,
         }
 
-    average = sum(total_scores) / len(total_scores)
-
-    # Determine trend (comparing first half to second half)
-    if len(total_scores) >= 2:
-        # Most recent is first, so recent avg vs older avg
-        mid = len(total_scores) // 2
-        recent_avg = sum(total_scores[:mid]) / mid
-        older_avg = sum(total_scores[mid:]) / (len(total_scores) - mid)
-
-        if recent_avg - older_avg > 0.3:
-            trend = "improving"
-        elif older_avg - recent_avg > 0.3:
-            trend = "declining"
-        else:
-            trend = "stable"
-    else:
-        trend = "stable"
+    average = fmean(total_scores)
+    trend = determine_trend(total_scores)
 
     return {
         "scores": total_scores,
@@ -0,0 +1,65 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.models import ScoreBase, ScoreColor, SurveyCategory
+from tests.utils.student import create_random_student
+
+
+def test_read_student_scores_pages_by_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    student = create_random_student(db)
+    created_ids = set()
+    for week_number in (1, 2, 3):
+        survey_session = crud.create_survey_session(
+            session=db, student_id=student.id, week_number=week_number, year=2025
+        )
+        scores = crud.create_scores_bulk(
+            session=db,
+            student_id=student.id,
+            session_id=survey_session.id,
+            scores=[
+                ScoreBase(category=category, score_value=3.0, color=ScoreColor.YELLOW)
+                for category in SurveyCategory
+            ]
+            + [ScoreBase(score_value=3.0, color=ScoreColor.YELLOW, is_total=True)],
+        )
+        created_ids.update(str(score.id) for score in scores)
+
+    url = f"{settings.API_V1_STR}/students/{student.id}/scores"
+    pages = []
+    params: dict[str, str | int] = {"limit": 4}
+    while True:
+        r = client.get(url, headers=superuser_token_headers, params=params)
+        assert r.status_code == 200
+        page = r.json()
+        pages.append(page["data"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 4, "cursor": page["next_cursor"]}
+
+    paged_ids = [score["id"] for data in pages for score in data]
+    assert len(paged_ids) == len(created_ids) == 18
+    assert set(paged_ids) == created_ids
+    # Each session's total comes before its categories
+    assert pages[0][0]["is_total"] is True
+
+    db.delete(student)
+    db.commit()
+
+
+def test_read_student_scores_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    student = create_random_student(db)
+    url = f"{settings.API_V1_STR}/students/{student.id}/scores"
+
+    for cursor in ("not-a-cursor", "bm9wZQ=="):
+        r = client.get(url, headers=superuser_token_headers, params={"cursor": cursor})
+        assert r.status_code == 400
+        assert r.json()["detail"] == "Invalid cursor"
+
+    db.delete(student)
+    db.commit()
@@ -0,0 +1,22 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_rescore_scores(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/system/rescore", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    assert r.json()["message"].startswith("Rescored ")
+
+
+def test_rescore_scores_requires_admin(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/system/rescore", headers=normal_user_token_headers
+    )
+    assert r.status_code == 403
@@ -0,0 +1,36 @@
+from sqlmodel import Session
+
+from app import crud
+from app.core.db import engine
+from app.models import NotificationCreate, NotificationType
+from tests.utils.student import create_random_student
+from tests.utils.user import create_random_user
+
+
+def test_create_notifications_bulk_readable_after_session_closes(
+    db: Session,
+) -> None:
+    user = create_random_user(db)
+    student = create_random_student(db)
+    notifications_in = [
+        NotificationCreate(
+            student_id=student.id,
+            user_id=user.id,
+            type=NotificationType.NON_RESPONSE,
+            title=f"Manglende besvarelse: {student.name}",
+            message=f"Eleven har ikke besvaret trivselstjekket for uge {week}.",
+        )
+        for week in (1, 2)
+    ]
+
+    with Session(engine) as session:
+        notifications = crud.create_notifications_bulk(
+            session=session, notifications_in=notifications_in
+        )
+
+    assert [n.message for n in notifications] == [n.message for n in notifications_in]
+    assert all(n.user_id == user.id for n in notifications)
+    assert all(n.sent_at is not None for n in notifications)
+
+    db.delete(student)
+    db.commit()
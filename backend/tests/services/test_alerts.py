@@ -0,0 +1,133 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import (
+    Notification,
+    NotificationType,
+    ScoreBase,
+    ScoreColor,
+    SessionStatus,
+    StudentAssignmentCreate,
+    SurveyCategory,
+    SurveySession,
+)
+from app.services import alerts
+from tests.utils.student import create_random_student
+from tests.utils.user import create_random_user
+
+
+def _create_session(
+    db: Session,
+    *,
+    student_id: uuid.UUID,
+    week_number: int,
+    status: SessionStatus | None,
+) -> SurveySession:
+    survey_session = crud.create_survey_session(
+        session=db, student_id=student_id, week_number=week_number, year=2025
+    )
+    if status is None:
+        survey_session.token_expires_at = datetime.utcnow() - timedelta(days=1)
+    else:
+        survey_session.status = status
+    db.add(survey_session)
+    db.commit()
+    return survey_session
+
+
+def test_process_expired_sessions_counts_weeks_expiring_together(
+    db: Session,
+) -> None:
+    mentor = create_random_user(db)
+    student = create_random_student(db)
+    crud.create_assignment(
+        session=db,
+        assignment_in=StudentAssignmentCreate(student_id=student.id, user_id=mentor.id),
+    )
+    _create_session(
+        db, student_id=student.id, week_number=1, status=SessionStatus.COMPLETED
+    )
+    _create_session(
+        db, student_id=student.id, week_number=2, status=SessionStatus.NON_RESPONSE
+    )
+    # Weeks 3 and 4 expire in the same sweep
+    _create_session(db, student_id=student.id, week_number=3, status=None)
+    _create_session(db, student_id=student.id, week_number=4, status=None)
+
+    asyncio.run(alerts.process_expired_sessions(db_session=db))
+
+    messages = sorted(
+        db.exec(
+            select(Notification.message).where(Notification.student_id == student.id)
+        ).all()
+    )
+    assert messages == [
+        "Eleven har ikke besvaret trivselstjekket for uge 3. "
+        "Dette er 2. uge i træk uden svar.",
+        "Eleven har ikke besvaret trivselstjekket for uge 4. "
+        "Dette er 3. uge i træk uden svar.",
+    ]
+
+    db.delete(student)
+    db.commit()
+
+
+def test_check_for_alerts_combines_critical_score_and_drop(db: Session) -> None:
+    mentor = create_random_user(db)
+    student = create_random_student(db)
+    crud.create_assignment(
+        session=db,
+        assignment_in=StudentAssignmentCreate(student_id=student.id, user_id=mentor.id),
+    )
+    previous_session = _create_session(
+        db, student_id=student.id, week_number=1, status=SessionStatus.COMPLETED
+    )
+    crud.create_scores_bulk(
+        session=db,
+        student_id=student.id,
+        session_id=previous_session.id,
+        scores=[ScoreBase(score_value=4.2, color=ScoreColor.GREEN, is_total=True)],
+    )
+    survey_session = _create_session(
+        db, student_id=student.id, week_number=2, status=SessionStatus.COMPLETED
+    )
+    scores = crud.create_scores_bulk(
+        session=db,
+        student_id=student.id,
+        session_id=survey_session.id,
+        scores=[
+            ScoreBase(
+                category=SurveyCategory.TRIVSEL,
+                score_value=1.5,
+                color=ScoreColor.RED,
+            ),
+            ScoreBase(score_value=2.5, color=ScoreColor.RED, is_total=True),
+        ],
+    )
+
+    notifications = asyncio.run(
+        alerts.check_for_alerts(
+            db_session=db,
+            survey_session=survey_session,
+            scores=scores,
+            student=student,
+        )
+    )
+
+    assert len(notifications) == 1
+    notification = notifications[0]
+    assert notification.user_id == mentor.id
+    assert notification.type == NotificationType.CRITICAL_SCORE_DROP
+    assert notification.title == f"Kritisk score og fald i trivsel: {student.name}"
+    assert notification.message == (
+        "Eleven har en kritisk trivselsscore på 2.5. "
+        "Kritiske kategorier: trivsel. "
+        "Elevens trivselsscore er faldet med 1.7 point (fra 4.2 til 2.5)."
+    )
+
+    db.delete(student)
+    db.commit()
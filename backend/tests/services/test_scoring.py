@@ -0,0 +1,148 @@
+import pytest
+from sqlmodel import Session, select, update
+
+from app import crud
+from app.core.config import settings
+from app.models import (
+    Score,
+    ScoreColor,
+    SessionStatus,
+    SurveyCategory,
+    SurveyResponse,
+    SurveyResponseCreate,
+)
+from app.services import scoring
+from app.services.scoring import compute_scores, determine_color, determine_trend
+from tests.utils.student import create_random_student
+
+
+def test_compute_scores_averages_each_category() -> None:
+    answers = [
+        (SurveyCategory.TRIVSEL, 5),
+        (SurveyCategory.TRIVSEL, 4),
+        (SurveyCategory.TRIVSEL, 3),
+        (SurveyCategory.MOTIVATION, 2),
+        (SurveyCategory.MOTIVATION, 3),
+        (SurveyCategory.MOTIVATION, 1),
+        # Custom question responses have no category and are not scored
+        (None, 1),
+    ]
+
+    category_scores, total_score = compute_scores(answers)
+
+    assert category_scores == {
+        SurveyCategory.TRIVSEL: 4.0,
+        SurveyCategory.MOTIVATION: 2.0,
+    }
+    assert total_score == 3.0
+
+
+def test_compute_scores_total_is_mean_of_category_scores() -> None:
+    # Uneven categories: the total averages the category scores, not the answers
+    answers = [
+        (SurveyCategory.TRIVSEL, 5),
+        (SurveyCategory.FAELLESSKAB, 1),
+        (SurveyCategory.FAELLESSKAB, 1),
+        (SurveyCategory.FAELLESSKAB, 1),
+    ]
+
+    _, total_score = compute_scores(answers)
+
+    assert total_score == 3.0
+
+
+def test_compute_scores_without_answers() -> None:
+    assert compute_scores([]) == ({}, 0.0)
+    assert compute_scores([(None, 4)]) == ({}, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("score", "color"),
+    [
+        (1.0, ScoreColor.RED),
+        (2.0, ScoreColor.RED),
+        (settings.SCORE_YELLOW_MIN - 0.01, ScoreColor.RED),
+        (settings.SCORE_YELLOW_MIN, ScoreColor.YELLOW),
+        (settings.SCORE_GREEN_MIN - 0.01, ScoreColor.YELLOW),
+        (settings.SCORE_GREEN_MIN, ScoreColor.GREEN),
+        (5.0, ScoreColor.GREEN),
+    ],
+)
+def test_determine_color_boundaries(score: float, color: ScoreColor) -> None:
+    assert determine_color(score) == color
+
+
+@pytest.mark.parametrize(
+    ("total_scores", "trend"),
+    [
+        ([], "stable"),
+        ([3.0], "stable"),
+        ([4.0, 3.0], "improving"),
+        ([3.0, 4.0], "declining"),
+        ([3.2, 3.0], "stable"),
+        # Odd lengths put the middle score in the older half
+        ([5.0, 4.0, 1.0, 1.0, 1.0], "improving"),
+        ([1.0, 1.0, 1.0, 4.0, 5.0], "declining"),
+        ([4.0, 4.0, 3.8, 3.8], "stable"),
+    ],
+)
+def test_determine_trend(total_scores: list[float], trend: str) -> None:
+    assert determine_trend(total_scores) == trend
+
+
+def test_rescore_students_updates_scores_and_latest_columns(db: Session) -> None:
+    student = create_random_student(db)
+    questions = crud.get_questions_for_student(session=db, student_phase=student.phase)
+    survey_session = crud.create_survey_session(
+        session=db, student_id=student.id, week_number=1, year=2025
+    )
+    responses = crud.create_responses_bulk(
+        session=db,
+        session_id=survey_session.id,
+        responses=[
+            SurveyResponseCreate(question_id=question.id, answer=5)
+            for question in questions
+        ],
+        question_categories={question.id: question.category for question in questions},
+    )
+    scoring.save_scores_for_session(
+        db_session=db, survey_session=survey_session, responses=responses
+    )
+    crud.update_session_status(
+        session=db, db_session=survey_session, status=SessionStatus.COMPLETED
+    )
+
+    # Lower every trivsel answer after the scores were stored
+    db.execute(
+        update(SurveyResponse)
+        .where(
+            SurveyResponse.session_id == survey_session.id,
+            SurveyResponse.category == SurveyCategory.TRIVSEL,
+        )
+        .values(answer=1)
+    )
+    db.commit()
+
+    rescored = scoring.rescore_students(db_session=db, student_ids=[student.id])
+
+    assert rescored == 1
+    db.expire_all()
+    scores = db.exec(select(Score).where(Score.student_id == student.id)).all()
+    category_count = len({question.category for question in questions})
+    expected_total = round((1 + 5 * (category_count - 1)) / category_count, 2)
+    for score in scores:
+        if score.is_total:
+            assert score.score_value == expected_total
+            assert score.color == determine_color(expected_total)
+        elif score.category == SurveyCategory.TRIVSEL:
+            assert score.score_value == 1.0
+            assert score.color == ScoreColor.RED
+        else:
+            assert score.score_value == 5.0
+            assert score.color == ScoreColor.GREEN
+    db.refresh(student)
+    assert student.latest_score == expected_total
+    assert student.latest_color == determine_color(expected_total)
+
+    db.delete(student)
+    db.commit()
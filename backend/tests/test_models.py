@@ -0,0 +1,18 @@
+import time
+import uuid
+
+from app.models import uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_time_ordered() -> None:
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert first.int >> 80 <= time.time_ns() // 1_000_000
@@ -0,0 +1,12 @@
+from sqlmodel import Session
+
+from app import crud
+from app.models import Student, StudentCreate
+from tests.utils.utils import random_email, random_lower_string
+
+
+def create_random_student(db: Session) -> Student:
+    name = random_lower_string()
+    email = random_email()
+    student_in = StudentCreate(name=name, email=email, consent_status=True)
+    return crud.create_student(session=db, student_in=student_in)
@@ -68,6 +68,14 @@ const alertTypeConfig: Record<
     badge: "bg-amber-100 text-amber-700 border-amber-200",
     label: "Score fald",
   },
+  critical_score_drop: {
+    icon: AlertTriangle,
+    gradient: "from-red-500/10 via-red-500/5 to-transparent",
+    iconBg: "bg-gradient-to-br from-red-100 to-red-50",
+    iconColor: "text-red-600",
+    badge: "bg-red-100 text-red-700 border-red-200",
+    label: "Kritisk score og fald",
+  },
   non_response: {
     icon: Clock,
     gradient: "from-blue-500/10 via-blue-500/5 to-transparent",
@@ -172,7 +180,9 @@ function AlertsPage() {
 
   const unreadAlerts = alerts?.data.filter((a) => !a.read_at) || []
   const readAlerts = alerts?.data.filter((a) => a.read_at) || []
-  const criticalCount = unreadAlerts.filter((a) => a.type === "critical_score").length
+  const criticalCount = unreadAlerts.filter(
+    (a) => a.type === "critical_score" || a.type === "critical_score_drop",
+  ).length
   const warningCount = unreadAlerts.filter((a) => a.type === "score_drop").length
 
   if (isLoading) {